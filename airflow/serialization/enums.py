@@ -42,4 +42,6 @@ class DagAttributeTypes(str, Enum):
     RELATIVEDELTA = 'relativedelta'
     DICT = 'dict'
     SET = 'set'
+    FROZENSET = 'frozenset'
     TUPLE = 'tuple'
+    BYTES = 'bytes'
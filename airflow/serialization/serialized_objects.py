@@ -16,14 +16,17 @@
 # under the License.
 
 """Serialized DAG and BaseOperator"""
+import base64
 import datetime
 import enum
 import logging
-from inspect import Parameter, signature
-from typing import Dict, Optional, Set, Union
+from collections import defaultdict
+from inspect import signature
+from typing import Callable, DefaultDict, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 import pendulum
 from dateutil import relativedelta
+from pendulum.tz.timezone import UTCTimezone
 
 from airflow import DAG, AirflowException, LoggingMixin
 from airflow.models import Connection
@@ -33,6 +36,38 @@ from airflow.serialization.json_schema import Validator, load_dag_schema
 from airflow.settings import json
 from airflow.www.utils import get_python_source
 
+# Plain str keys of encoded objects, used on the hot paths instead of the Encoding members.
+_ENC_VAR: str = Encoding.VAR.value
+_ENC_TYPE: str = Encoding.TYPE.value
+
+# Exact types of JSON primitives, returned as is without recursing into _serialize.
+# Subclasses such as enum.IntEnum still go through _serialize.
+_PRIMITIVE_TYPES_SET = frozenset({int, str, bool, float, type(None)})
+
+# Concrete timezone classes of pendulum, dispatched by exact type in _serialize.
+_EXACT_TZ_TYPES = (
+    pendulum.tz.Timezone,
+    pendulum.tz.FixedTimezone,
+    type(UTCTimezone),
+    pendulum.tz.timezone_info.TimezoneInfo,
+    type(pendulum.tz.timezone_info.UTC),
+)
+
+# Sentinel for attributes not found in an object's __dict__.
+_MISSING = object()
+
+
+class _KeyDecoders(dict):
+    """Maps attribute names to decoders, computing them with ``_get_key_decoder`` on first use."""
+
+    def __init__(self, serialization_cls):
+        super().__init__()
+        self.serialization_cls = serialization_cls
+
+    def __missing__(self, key):
+        decoder = self[key] = self.serialization_cls._get_key_decoder(key)  # pylint: disable=protected-access
+        return decoder
+
 
 class BaseSerialization:
     """BaseSerialization provides utils for serialization."""
@@ -50,10 +85,23 @@ class BaseSerialization:
 
     _json_schema: Optional[Validator] = None
 
-    _CONSTRUCTOR_PARAMS: Dict[str, Parameter] = {}
+    # Maps constructor params (as attribute names) to their hard-coded default values.
+    _CONSTRUCTOR_DEFAULTS: Dict[str, object] = {}
+
+    # The serialized fields minus the constructor params, i.e. the fields to reset
+    # to None if not present in the serialized form. Set on first use, as computing
+    # the serialized fields instantiates a DAG / operator.
+    _nullable_fields: Optional[FrozenSet[str]] = None
+
+    # Decoders of the serialized attributes, created for each subclass.
+    _key_decoders: _KeyDecoders
 
     SERIALIZER_VERSION = 1
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._key_decoders = _KeyDecoders(cls)
+
     @classmethod
     def to_json(cls, var: Union[DAG, BaseOperator, dict, list, set, tuple]) -> str:
         """Stringifies DAGs and operators contained by var and returns a JSON string of var.
@@ -69,7 +117,9 @@ class BaseSerialization:
         raise NotImplementedError()
 
     @classmethod
-    def from_json(cls, serialized_obj: str) -> Union['BaseSerialization', dict, list, set, tuple]:
+    def from_json(
+        cls, serialized_obj: Union[str, bytes]
+    ) -> Union['BaseSerialization', dict, list, set, tuple]:
         """Deserializes json_str and reconstructs all DAGs and operators it contains."""
         return cls.from_dict(json.loads(serialized_obj))
 
@@ -80,22 +130,26 @@ class BaseSerialization:
         return cls._deserialize(serialized_obj)
 
     @classmethod
-    def validate_schema(cls, serialized_obj: Union[str, dict]):
-        """Validate serialized_obj satisfies JSON schema."""
+    def validate_schema(cls, serialized_obj: Union[str, bytes, dict]):
+        """Validate serialized_obj satisfies JSON schema.
+
+        Pass the dict form where available (e.g. the output of ``to_dict``) to
+        avoid parsing the JSON again.
+        """
         if cls._json_schema is None:
             raise AirflowException('JSON schema of {:s} is not set.'.format(cls.__name__))
 
         if isinstance(serialized_obj, dict):
             cls._json_schema.validate(serialized_obj)
-        elif isinstance(serialized_obj, str):
+        elif isinstance(serialized_obj, (str, bytes)):
             cls._json_schema.validate(json.loads(serialized_obj))
         else:
-            raise TypeError("Invalid type: Only dict and str are supported.")
+            raise TypeError("Invalid type: Only dict, str and bytes are supported.")
 
     @staticmethod
     def _encode(x, type_):
         """Encode data by a JSON dict."""
-        return {Encoding.VAR: x, Encoding.TYPE: type_}
+        return {_ENC_VAR: x, _ENC_TYPE: type_}
 
     @classmethod
     def _is_primitive(cls, var):
@@ -112,26 +166,73 @@ class BaseSerialization:
             cls._value_is_hardcoded_default(attrname, var)
         )
 
+    @classmethod
+    def get_serialized_fields(cls) -> FrozenSet[str]:
+        """Stringified DAGs and operators contain exactly these fields."""
+        # Provided by DAG / BaseOperator, which come first in the MRO of the subclasses.
+        raise NotImplementedError()
+
+    @classmethod
+    def _get_nullable_fields(cls) -> FrozenSet[str]:
+        """
+        Return the serialized fields of ``cls`` that are not constructor params.
+
+        Any of these missing from an encoded object are set to None on deserialization.
+        """
+        if cls._nullable_fields is None:
+            cls._nullable_fields = cls.get_serialized_fields() - cls._CONSTRUCTOR_DEFAULTS.keys()
+        return cls._nullable_fields
+
+    @classmethod
+    def _get_key_decoder(cls, key: str) -> Optional[Callable]:
+        """
+        Return the function decoding the serialized value of attribute ``key``,
+        or None if the value is used as it is.
+        """
+        raise NotImplementedError()
+
     @classmethod
     def serialize_to_json(cls, object_to_serialize: Union[BaseOperator, DAG], decorated_fields: Set):
         """Serializes an object to json"""
         serialized_object = {}
         keys_to_serialize = object_to_serialize.get_serialized_fields()
+        # Most fields are plain instance attributes: read them from __dict__ and only
+        # fall back to getattr for class attributes and properties.
+        obj_dict = getattr(object_to_serialize, '__dict__', None)
         for key in keys_to_serialize:
             # None is ignored in serialized form and is added back in deserialization.
-            value = getattr(object_to_serialize, key, None)
+            value = obj_dict.get(key, _MISSING) if obj_dict is not None else _MISSING
+            if value is _MISSING:
+                value = getattr(object_to_serialize, key, None)
             if cls._is_excluded(value, key, object_to_serialize):
                 continue
 
             if key in decorated_fields:
                 serialized_object[key] = cls._serialize(value)
             else:
-                value = cls._serialize(value)
-                if isinstance(value, dict) and "__type" in value:
-                    value = value["__var"]
-                serialized_object[key] = value
+                serialized_object[key] = cls._serialize_naked(value)
         return serialized_object
 
+    @classmethod
+    def _serialize_naked(cls, var):
+        """
+        Like ``_serialize``, but returns the payload of encoded types without
+        the ``{TYPE: 'foo', VAR: 'bar'}`` wrapper.
+        """
+        handler = cls._SERIALIZE_DISPATCH.get(type(var))
+        if handler is not None:
+            serialize, _ = handler
+            try:
+                return serialize(cls, var)
+            except Exception:  # pylint: disable=broad-except
+                LOG.warning('Failed to stringify.', exc_info=True)
+                return FAILED
+
+        value = cls._serialize(var)
+        if isinstance(value, dict) and _ENC_TYPE in value:
+            value = value[_ENC_VAR]
+        return value
+
     @classmethod
     def _serialize(cls, var):  # pylint: disable=too-many-return-statements
         """Helper function of depth first search for serialization.
@@ -143,20 +244,27 @@ class BaseSerialization:
             step decode VAR according to TYPE;
         (3) Operator has a special field CLASS to record the original class
             name for displaying in UI.
+
+        The exact type of ``var`` is looked up in ``_SERIALIZE_DISPATCH`` first;
+        subclasses and other types fall through to the ``isinstance`` checks.
         """
         try:
+            handler = cls._SERIALIZE_DISPATCH.get(type(var))
+            if handler is not None:
+                serialize, type_ = handler
+                if type_ is None:
+                    return serialize(cls, var)
+                return cls._encode(serialize(cls, var), type_=type_)
+
             if cls._is_primitive(var):
                 # enum.IntEnum is an int instance, it causes json dumps error so we use its value.
                 if isinstance(var, enum.Enum):
                     return var.value
                 return var
             elif isinstance(var, dict):
-                return cls._encode(
-                    {str(k): cls._serialize(v) for k, v in var.items()},
-                    type_=DAT.DICT
-                )
+                return cls._encode(cls._serialize_dict(var), type_=DAT.DICT)
             elif isinstance(var, list):
-                return [cls._serialize(v) for v in var]
+                return cls._serialize_list(var)
             elif isinstance(var, DAG):
                 return SerializedDAG.serialize_dag(var)
             elif isinstance(var, BaseOperator):
@@ -166,25 +274,21 @@ class BaseSerialization:
             elif isinstance(var, datetime.timedelta):
                 return cls._encode(var.total_seconds(), type_=DAT.TIMEDELTA)
             elif isinstance(var, (pendulum.tz.Timezone, pendulum.tz.timezone_info.TimezoneInfo)):
-                return cls._encode(str(var.name), type_=DAT.TIMEZONE)
+                return cls._encode(cls._serialize_timezone(var), type_=DAT.TIMEZONE)
             elif isinstance(var, relativedelta.relativedelta):
-                encoded = {k: v for k, v in var.__dict__.items() if not k.startswith("_") and v}
-                if var.weekday and var.weekday.n:
-                    # Every n'th Friday for example
-                    encoded['weekday'] = [var.weekday.weekday, var.weekday.n]
-                elif var.weekday:
-                    encoded['weekday'] = [var.weekday.weekday]
-                return cls._encode(encoded, type_=DAT.RELATIVEDELTA)
+                return cls._encode(cls._serialize_relativedelta(var), type_=DAT.RELATIVEDELTA)
             elif callable(var):
                 return str(get_python_source(var))
             elif isinstance(var, set):
                 # FIXME: casts set to list in customized serialization in future.
-                return cls._encode(
-                    [cls._serialize(v) for v in var], type_=DAT.SET)
+                return cls._encode(cls._serialize_list(var), type_=DAT.SET)
+            elif isinstance(var, frozenset):
+                return cls._encode(cls._serialize_list(var), type_=DAT.FROZENSET)
             elif isinstance(var, tuple):
                 # FIXME: casts tuple to list in customized serialization in future.
-                return cls._encode(
-                    [cls._serialize(v) for v in var], type_=DAT.TUPLE)
+                return cls._encode(cls._serialize_list(var), type_=DAT.TUPLE)
+            elif isinstance(var, bytes):
+                return cls._encode(cls._serialize_bytes(var), type_=DAT.BYTES)
             else:
                 LOG.debug('Cast type %s to str in serialization.', type(var))
                 return str(var)
@@ -192,41 +296,102 @@ class BaseSerialization:
             LOG.warning('Failed to stringify.', exc_info=True)
             return FAILED
 
+    # The _serialize_* helpers return the (not yet encoded) payload of var.
+
+    @classmethod
+    def _serialize_primitive(cls, var):
+        return var
+
+    @classmethod
+    def _serialize_bytes(cls, var: bytes) -> str:
+        return base64.b64encode(var).decode('ascii')
+
+    @classmethod
+    def _serialize_dict(cls, var: dict) -> dict:
+        # Hot loop: bind to locals to save an attribute and a global lookup per item.
+        serialize = cls._serialize
+        primitive_types = _PRIMITIVE_TYPES_SET
+        return {
+            (k if type(k) is str else str(k)): (v if type(v) in primitive_types else serialize(v))
+            for k, v in var.items()
+        }
+
+    @classmethod
+    def _serialize_list(cls, var) -> list:
+        serialize = cls._serialize
+        primitive_types = _PRIMITIVE_TYPES_SET
+        return [v if type(v) in primitive_types else serialize(v) for v in var]
+
     @classmethod
-    def _deserialize(cls, encoded_var):  # pylint: disable=too-many-return-statements
+    def _serialize_dag(cls, var: DAG) -> dict:
+        return SerializedDAG.serialize_dag(var)
+
+    @classmethod
+    def _serialize_operator(cls, var: BaseOperator) -> dict:
+        return SerializedBaseOperator.serialize_operator(var)
+
+    @classmethod
+    def _serialize_datetime(cls, var: datetime.datetime) -> float:
+        return var.timestamp()
+
+    @classmethod
+    def _serialize_timedelta(cls, var: datetime.timedelta) -> float:
+        return var.total_seconds()
+
+    @classmethod
+    def _serialize_timezone(cls, var) -> str:
+        return str(var.name)
+
+    @classmethod
+    def _serialize_relativedelta(cls, var: relativedelta.relativedelta) -> dict:
+        encoded = {k: v for k, v in var.__dict__.items() if not k.startswith("_") and v}
+        if var.weekday and var.weekday.n:
+            # Every n'th Friday for example
+            encoded['weekday'] = [var.weekday.weekday, var.weekday.n]
+        elif var.weekday:
+            encoded['weekday'] = [var.weekday.weekday]
+        return encoded
+
+    # Maps the exact type of a value to ``(handler, type_)``: ``handler(cls, var)``
+    # returns the payload, which is encoded with ``type_`` unless that is None.
+    _SERIALIZE_DISPATCH: Dict[type, Tuple[Callable, Optional[DAT]]] = {
+        int: (_serialize_primitive.__func__, None),  # type: ignore
+        bool: (_serialize_primitive.__func__, None),  # type: ignore
+        float: (_serialize_primitive.__func__, None),  # type: ignore
+        str: (_serialize_primitive.__func__, None),  # type: ignore
+        type(None): (_serialize_primitive.__func__, None),  # type: ignore
+        dict: (_serialize_dict.__func__, DAT.DICT),  # type: ignore
+        list: (_serialize_list.__func__, None),  # type: ignore
+        DAG: (_serialize_dag.__func__, None),  # type: ignore
+        BaseOperator: (_serialize_operator.__func__, None),  # type: ignore
+        datetime.datetime: (_serialize_datetime.__func__, DAT.DATETIME),  # type: ignore
+        pendulum.Pendulum: (_serialize_datetime.__func__, DAT.DATETIME),  # type: ignore
+        datetime.timedelta: (_serialize_timedelta.__func__, DAT.TIMEDELTA),  # type: ignore
+        **dict.fromkeys(_EXACT_TZ_TYPES, (_serialize_timezone.__func__, DAT.TIMEZONE)),  # type: ignore
+        relativedelta.relativedelta: (_serialize_relativedelta.__func__, DAT.RELATIVEDELTA),  # type: ignore
+        set: (_serialize_list.__func__, DAT.SET),  # type: ignore
+        frozenset: (_serialize_list.__func__, DAT.FROZENSET),  # type: ignore
+        tuple: (_serialize_list.__func__, DAT.TUPLE),  # type: ignore
+        bytes: (_serialize_bytes.__func__, DAT.BYTES),  # type: ignore
+    }
+
+    @classmethod
+    def _deserialize(cls, encoded_var):
         """Helper function of depth first search for deserialization."""
         # JSON primitives (except for dict) are not encoded.
         if cls._is_primitive(encoded_var):
             return encoded_var
         elif isinstance(encoded_var, list):
-            return [cls._deserialize(v) for v in encoded_var]
+            return cls._deserialize_list(encoded_var)
 
         assert isinstance(encoded_var, dict)
-        var = encoded_var[Encoding.VAR]
-        type_ = encoded_var[Encoding.TYPE]
-
-        if type_ == DAT.DICT:
-            return {k: cls._deserialize(v) for k, v in var.items()}
-        elif type_ == DAT.DAG:
-            return SerializedDAG.deserialize_dag(var)
-        elif type_ == DAT.OP:
-            return SerializedBaseOperator.deserialize_operator(var)
-        elif type_ == DAT.DATETIME:
-            return pendulum.from_timestamp(var)
-        elif type_ == DAT.TIMEDELTA:
-            return datetime.timedelta(seconds=var)
-        elif type_ == DAT.TIMEZONE:
-            return pendulum.timezone(var)
-        elif type_ == DAT.RELATIVEDELTA:
-            if 'weekday' in var:
-                var['weekday'] = relativedelta.weekday(*var['weekday'])
-            return relativedelta.relativedelta(**var)
-        elif type_ == DAT.SET:
-            return {cls._deserialize(v) for v in var}
-        elif type_ == DAT.TUPLE:
-            return tuple([cls._deserialize(v) for v in var])
-        else:
+        var = encoded_var[_ENC_VAR]
+        type_ = encoded_var[_ENC_TYPE]
+
+        deserialize = cls._DESERIALIZE_DISPATCH.get(type_)
+        if deserialize is None:
             raise TypeError('Invalid type {!s} in deserialization.'.format(type_))
+        return deserialize(cls, var)
 
     _deserialize_datetime = pendulum.from_timestamp
     _deserialize_timezone = pendulum.timezone
@@ -235,6 +400,61 @@ class BaseSerialization:
     def _deserialize_timedelta(cls, seconds):
         return datetime.timedelta(seconds=seconds)
 
+    # Like the _serialize_* helpers, the container helpers below keep JSON primitives
+    # as they are instead of recursing into _deserialize for every leaf.
+
+    @classmethod
+    def _deserialize_list(cls, var: list) -> list:
+        deserialize = cls._deserialize
+        primitive_types = _PRIMITIVE_TYPES_SET
+        return [v if type(v) in primitive_types else deserialize(v) for v in var]
+
+    @classmethod
+    def _deserialize_dict(cls, var: dict) -> dict:
+        deserialize = cls._deserialize
+        primitive_types = _PRIMITIVE_TYPES_SET
+        return {k: (v if type(v) in primitive_types else deserialize(v)) for k, v in var.items()}
+
+    @classmethod
+    def _deserialize_relativedelta(cls, var: dict) -> relativedelta.relativedelta:
+        if 'weekday' in var:
+            var['weekday'] = relativedelta.weekday(*var['weekday'])
+        return relativedelta.relativedelta(**var)
+
+    @classmethod
+    def _deserialize_set(cls, var: list) -> set:
+        deserialize = cls._deserialize
+        primitive_types = _PRIMITIVE_TYPES_SET
+        return {v if type(v) in primitive_types else deserialize(v) for v in var}
+
+    @classmethod
+    def _deserialize_frozenset(cls, var: list) -> frozenset:
+        return frozenset(cls._deserialize_list(var))
+
+    @classmethod
+    def _deserialize_tuple(cls, var: list) -> tuple:
+        return tuple(cls._deserialize_list(var))
+
+    @classmethod
+    def _deserialize_bytes(cls, var: str) -> bytes:
+        return base64.b64decode(var)
+
+    # Maps the encoded type to ``handler(cls, var)`` returning the decoded value.
+    # DagAttributeTypes is a str enum, so plain strings from JSON hit the same keys.
+    _DESERIALIZE_DISPATCH: Dict[DAT, Callable] = {
+        DAT.DICT: _deserialize_dict.__func__,  # type: ignore
+        DAT.DAG: lambda cls, var: SerializedDAG.deserialize_dag(var),
+        DAT.OP: lambda cls, var: SerializedBaseOperator.deserialize_operator(var),
+        DAT.DATETIME: lambda cls, var: cls._deserialize_datetime(var),
+        DAT.TIMEDELTA: _deserialize_timedelta.__func__,  # type: ignore
+        DAT.TIMEZONE: lambda cls, var: cls._deserialize_timezone(var),
+        DAT.RELATIVEDELTA: _deserialize_relativedelta.__func__,  # type: ignore
+        DAT.SET: _deserialize_set.__func__,  # type: ignore
+        DAT.FROZENSET: _deserialize_frozenset.__func__,  # type: ignore
+        DAT.TUPLE: _deserialize_tuple.__func__,  # type: ignore
+        DAT.BYTES: _deserialize_bytes.__func__,  # type: ignore
+    }
+
     @classmethod
     def _value_is_hardcoded_default(cls, attrname, value):
         """
@@ -248,9 +468,7 @@ class BaseSerialization:
         default. (This is because ``"default" is "default"`` will be False as
         they are different strings with the same characters.)
         """
-        if attrname in cls._CONSTRUCTOR_PARAMS and cls._CONSTRUCTOR_PARAMS[attrname].default is value:
-            return True
-        return False
+        return attrname in cls._CONSTRUCTOR_DEFAULTS and cls._CONSTRUCTOR_DEFAULTS[attrname] is value
 
 
 class SerializedBaseOperator(BaseOperator, BaseSerialization):
@@ -262,8 +480,8 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
 
     _decorated_fields = {'executor_config', }
 
-    _CONSTRUCTOR_PARAMS = {
-        k: v for k, v in signature(BaseOperator).parameters.items()
+    _CONSTRUCTOR_DEFAULTS = {
+        k: v.default for k, v in signature(BaseOperator).parameters.items()
         if v.default is not v.empty and v.default is not None
     }
 
@@ -308,35 +526,43 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         # Extra Operator Links
         op_extra_links_from_plugin = {}
 
+        task_type = encoded_op["_task_type"]
+        task_module = encoded_op["_task_module"]
         for ope in operator_extra_links:
             for operator in ope.operators:
-                if operator.__name__ == encoded_op["_task_type"] and \
-                        operator.__module__ == encoded_op["_task_module"]:
+                if operator.__name__ == task_type and operator.__module__ == task_module:
                     op_extra_links_from_plugin.update({ope.name: ope})
 
         setattr(op, "operator_extra_links", list(op_extra_links_from_plugin.values()))
 
+        decoded = dict.fromkeys(cls._get_nullable_fields() - encoded_op.keys())
+        key_decoders = cls._key_decoders
         for k, v in encoded_op.items():
-
-            if k == "_downstream_task_ids":
-                v = set(v)
-            elif k == "subdag":
-                v = SerializedDAG.deserialize_dag(v)
-            elif k in {"retry_delay", "execution_timeout"}:
-                v = cls._deserialize_timedelta(v)
-            elif k.endswith("_date"):
-                v = cls._deserialize_datetime(v)
-            elif k in cls._decorated_fields or k not in op.get_serialized_fields():
-                v = cls._deserialize(v)
-            # else use v as it is
-
-            setattr(op, k, v)
-
-        for k in op.get_serialized_fields() - encoded_op.keys() - cls._CONSTRUCTOR_PARAMS.keys():
-            setattr(op, k, None)
+            decoder = key_decoders[k]
+            if decoder is not None:
+                v = decoder(v)
+            decoded[k] = v
+        # No serialized field is a data descriptor (e.g. a property with a setter),
+        # so this is equivalent to calling setattr for each of them.
+        op.__dict__.update(decoded)
 
         return op
 
+    @classmethod
+    def _get_key_decoder(cls, key):  # pylint: disable=too-many-return-statements
+        if key == "_downstream_task_ids":
+            return set
+        elif key == "subdag":
+            return SerializedDAG.deserialize_dag
+        elif key in {"retry_delay", "execution_timeout"}:
+            return cls._deserialize_timedelta
+        elif key.endswith("_date"):
+            return cls._deserialize_datetime
+        elif key in cls._decorated_fields or key not in cls.get_serialized_fields():
+            return cls._deserialize
+        # else use the value as it is
+        return None
+
     @classmethod
     def _is_excluded(cls, var, attrname, op):
         if var is not None and op.has_dag() and attrname.endswith("_date"):
@@ -375,10 +601,10 @@ class SerializedDAG(DAG, BaseSerialization):
             'access_control': '_access_control',
         }
         return {
-            param_to_attr.get(k, k): v for k, v in signature(DAG).parameters.items()
+            param_to_attr.get(k, k): v.default for k, v in signature(DAG).parameters.items()
             if v.default is not v.empty and v.default is not None
         }
-    _CONSTRUCTOR_PARAMS = __get_constructor_defaults.__func__()  # type: ignore
+    _CONSTRUCTOR_DEFAULTS = __get_constructor_defaults.__func__()  # type: ignore
     del __get_constructor_defaults
 
     _json_schema = load_dag_schema()
@@ -389,7 +615,7 @@ class SerializedDAG(DAG, BaseSerialization):
         """
         serialize_dag = cls.serialize_to_json(dag, cls._decorated_fields)
 
-        serialize_dag["tasks"] = [cls._serialize(task) for _, task in dag.task_dict.items()]
+        serialize_dag["tasks"] = [cls._serialize(task) for task in dag.task_dict.values()]
         return serialize_dag
 
     @classmethod
@@ -398,34 +624,30 @@ class SerializedDAG(DAG, BaseSerialization):
         """
         dag = SerializedDAG(dag_id=encoded_dag['_dag_id'])
 
+        decoded = dict.fromkeys(cls._get_nullable_fields() - encoded_dag.keys())
+        key_decoders = cls._key_decoders
         for k, v in encoded_dag.items():
-            if k == "_downstream_task_ids":
-                v = set(v)
-            elif k == "tasks":
-                v = {
-                    task["task_id"]: SerializedBaseOperator.deserialize_operator(task) for task in v
-                }
-                k = "task_dict"
-            elif k == "timezone":
-                v = cls._deserialize_timezone(v)
-            elif k in {"retry_delay", "execution_timeout"}:
-                v = cls._deserialize_timedelta(v)
-            elif k.endswith("_date"):
-                v = cls._deserialize_datetime(v)
-            elif k in cls._decorated_fields:
-                v = cls._deserialize(v)
-            # else use v as it is
-
-            setattr(dag, k, v)
-
-        keys_to_set_none = dag.get_serialized_fields() - encoded_dag.keys() - cls._CONSTRUCTOR_PARAMS.keys()
-        for k in keys_to_set_none:
-            setattr(dag, k, None)
+            if k == "tasks":
+                # Deserialized below, once the DAG's own attributes are set.
+                continue
+            decoder = key_decoders[k]
+            if decoder is not None:
+                v = decoder(v)
+            decoded[k] = v
+        # No serialized field is a data descriptor, see deserialize_operator.
+        dag.__dict__.update(decoded)
 
         setattr(dag, 'full_filepath', dag.fileloc)
-        for task in dag.task_dict.values():
-            task.dag = dag
-            serializable_task: BaseOperator = task
+
+        # Deserialize and attach each task to the DAG in a single pass. Upstream ids
+        # can only be set once all tasks exist, so those are collected per task here.
+        dag.task_dict = {}
+        upstream_ids: DefaultDict[str, List[str]] = defaultdict(list)
+        for encoded_task in encoded_dag.get("tasks", []):
+            serializable_task: BaseOperator = SerializedBaseOperator.deserialize_operator(encoded_task)
+            # Add the task to task_dict first so the dag setter doesn't call add_task().
+            dag.task_dict[serializable_task.task_id] = serializable_task
+            serializable_task.dag = dag
 
             for date_attr in ["start_date", "end_date"]:
                 if getattr(serializable_task, date_attr) is None:
@@ -436,12 +658,32 @@ class SerializedDAG(DAG, BaseSerialization):
                 serializable_task.subdag.is_subdag = True
 
             for task_id in serializable_task.downstream_task_ids:
-                # Bypass set_upstream etc here - it does more than we want
-                # noinspection PyProtectedMember
-                dag.task_dict[task_id]._upstream_task_ids.add(task_id)  # pylint: disable=protected-access
+                upstream_ids[task_id].append(serializable_task.task_id)
+
+        for task_id, task_upstream_ids in upstream_ids.items():
+            # Bypass set_upstream etc here - it does more than we want
+            # noinspection PyProtectedMember
+            dag.task_dict[task_id]._upstream_task_ids.update(  # pylint: disable=protected-access
+                task_upstream_ids
+            )
 
         return dag
 
+    @classmethod
+    def _get_key_decoder(cls, key):  # pylint: disable=too-many-return-statements
+        if key == "_downstream_task_ids":
+            return set
+        elif key == "timezone":
+            return cls._deserialize_timezone
+        elif key in {"retry_delay", "execution_timeout"}:
+            return cls._deserialize_timedelta
+        elif key.endswith("_date"):
+            return cls._deserialize_datetime
+        elif key in cls._decorated_fields:
+            return cls._deserialize
+        # else use the value as it is
+        return None
+
     @classmethod
     def to_dict(cls, var) -> dict:
         """Stringifies DAGs and operators contained by var and returns a dict of var.
@@ -19,11 +19,13 @@
 
 """Unit tests for stringified DAGs."""
 
+import math
 import multiprocessing
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
 
+import pendulum
 from dateutil.relativedelta import FR, relativedelta
 from parameterized import parameterized
 
@@ -36,6 +38,7 @@ from airflow.models.baseoperator import BaseOperator
 from airflow.operators.bash_operator import BashOperator
 from airflow.operators.subdag_operator import SubDagOperator
 from airflow.serialization.serialized_objects import SerializedBaseOperator, SerializedDAG
+from airflow.utils import timezone
 from airflow.utils.tests import CustomBaseOperator, GoogleLink
 
 serialized_simple_dag_ground_truth = {
@@ -341,6 +344,21 @@ class TestStringifiedDAGs(unittest.TestCase):
         simple_task = dag.task_dict["simple_task"]
         self.assertEqual(simple_task.end_date, expected_task_end_date)
 
+    def test_deserialization_upstream_task_ids(self):
+        dag = DAG(dag_id='simple_dag', start_date=datetime(2019, 8, 1))
+        task1 = BaseOperator(task_id='task1', dag=dag)
+        task2 = BaseOperator(task_id='task2', dag=dag)
+        task3 = BaseOperator(task_id='task3', dag=dag)
+        task1 >> [task2, task3]
+        task2 >> task3
+
+        dag = SerializedDAG.from_dict(SerializedDAG.to_dict(dag))
+
+        self.assertEqual(dag.task_dict['task1'].upstream_task_ids, set())
+        self.assertEqual(dag.task_dict['task2'].upstream_task_ids, {'task1'})
+        self.assertEqual(dag.task_dict['task3'].upstream_task_ids, {'task1', 'task2'})
+        self.assertEqual(dag.task_dict['task1'].downstream_task_ids, {'task2', 'task3'})
+
     @parameterized.expand([
         (None, None),
         ("@weekly", "@weekly"),
@@ -381,6 +399,72 @@ class TestStringifiedDAGs(unittest.TestCase):
         round_tripped = SerializedDAG._deserialize(serialized)
         self.assertEqual(val, round_tripped)
 
+    @parameterized.expand([
+        (frozenset({1, "a"}),),
+        ({frozenset({1, 2}), frozenset({3})},),
+        ([1, (2, "b"), {"c": {3}}],),
+        (b"\x00\xffabc",),
+        ({"key": b"value", "nested": [b""]},),
+    ])
+    def test_roundtrip_containers(self, val):
+        serialized = SerializedDAG._serialize(val)
+        round_tripped = SerializedDAG._deserialize(serialized)
+        self.assertEqual(val, round_tripped)
+        self.assertEqual(type(val), type(round_tripped))
+
+    def test_serialize_frozenset(self):
+        serialized = SerializedDAG._serialize(frozenset({1}))
+        self.assertDictEqual(serialized, {"__type": "frozenset", "__var": [1]})
+
+    def test_serialize_bytes(self):
+        serialized = SerializedDAG._serialize(b"abc")
+        self.assertDictEqual(serialized, {"__type": "bytes", "__var": "YWJj"})
+
+    @parameterized.expand([
+        (timezone.utc, "UTC"),
+        (pendulum.timezone("Europe/Amsterdam"), "Europe/Amsterdam"),
+        (pendulum.tz.UTC, "UTC"),
+    ])
+    def test_serialize_timezone_dispatch(self, tz, expected):
+        self.assertIn(type(tz), SerializedDAG._SERIALIZE_DISPATCH)
+        self.assertDictEqual(SerializedDAG._serialize(tz), {"__type": "timezone", "__var": expected})
+
+    def test_bytes_input(self):
+        dag = make_simple_dag()['simple_dag']
+        serialized = SerializedDAG.to_json(dag).encode()
+        SerializedDAG.validate_schema(serialized)
+        round_tripped = SerializedDAG.from_json(serialized)
+        self.assertEqual(set(round_tripped.task_dict), set(dag.task_dict))
+
+    def test_validate_schema_invalid_type(self):
+        with self.assertRaisesRegex(TypeError, "Only dict, str and bytes are supported"):
+            SerializedDAG.validate_schema(["not", "a", "dag"])
+
+    @parameterized.expand([
+        (SerializedBaseOperator,),
+        (SerializedDAG,),
+    ])
+    def test_serialized_fields_are_not_data_descriptors(self, klass):
+        # The deserialized attributes are merged into the instance __dict__, which
+        # would be shadowed by a data descriptor (e.g. a property with a setter).
+        descriptors = {
+            name for name in klass.get_serialized_fields()
+            if hasattr(type(getattr(klass, name, None)), '__set__')
+        }
+        self.assertSetEqual(descriptors, set())
+
+    def test_to_json_roundtrip_special_numbers(self):
+        default_args = {
+            "nan": float("nan"), "inf": float("inf"), "ninf": float("-inf"), "big": 2 ** 70,
+        }
+        dag = DAG(dag_id="special_numbers", start_date=datetime(2019, 8, 1), default_args=default_args)
+        round_tripped = SerializedDAG.from_json(SerializedDAG.to_json(dag)).default_args
+        self.assertTrue(math.isnan(round_tripped["nan"]))
+        self.assertEqual(round_tripped["inf"], float("inf"))
+        self.assertEqual(round_tripped["ninf"], float("-inf"))
+        self.assertEqual(round_tripped["big"], 2 ** 70)
+        self.assertIsInstance(round_tripped["big"], int)
+
 
 if __name__ == '__main__':
     unittest.main()